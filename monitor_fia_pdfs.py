@@ -1,13 +1,32 @@
 import os
 import json
+import html
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from bs4 import BeautifulSoup, SoupStrainer
 import logging
 from datetime import datetime
+from string import Template
 import re
 import subprocess
 import shutil
 import time
+import functools
+import hashlib
+import multiprocessing
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
+
+try:
+    import lxml  # noqa: F401 - only needed as a BeautifulSoup backend
+    HTML_PARSER = 'lxml'
+except ImportError:
+    HTML_PARSER = 'html.parser'
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Configure logging
 logging.basicConfig(
@@ -22,202 +41,377 @@ logger = logging.getLogger(__name__)
 
 # Constants
 FIA_URL = "https://www.fia.com/documents/championships/fia-formula-one-world-championship-14/"
-PROCESSED_FILE = "processed_pdfs.json"
+PROCESSED_FILE = "processed_pdfs.json"  # Legacy ledger, migrated to the log below
+PROCESSED_LOG_FILE = "processed_pdfs.jsonl"  # One JSON record per line, append-only
+PROCESSED_URLS_FILE = "processed_urls.txt"  # One URL per line, for fast skips
+HTTP_CACHE_FILE = "http_cache.json"  # ETag / Last-Modified per URL
+LINKS_CACHE_FILE = "index_cache.json"  # PDF links from the last full scrape
 OUTPUT_DIR = "docs"
 HTML_DIR = os.path.join(OUTPUT_DIR, "html")
 PDF_DIR = os.path.join(OUTPUT_DIR, "pdf")
+DOWNLOAD_WORKERS = 8  # Concurrent downloads against fia.com
+DOWNLOAD_CHUNK_SIZE = 1 << 20  # 1 MiB per read while streaming PDFs
+REQUEST_TIMEOUT = (5, 60)  # (connect, read) seconds
+MAX_PDF_SIZE = 500 * 1024 * 1024  # FIA documents are far below this
+# Below 2x this, a PDF's text is extracted in one process. A spawned worker
+# takes ~0.5 s to start (it re-imports this script) against ~1.3 ms per page
+# for PDFium, so each worker needs hundreds of pages to pay for itself
+PAGES_PER_WORKER = 512
+
+# Characters not allowed in generated filenames
+UNSAFE_FILENAME_CHARS = re.compile(r'[^\w\-\.]')
+
+# Only <a> tags pointing at PDFs are built into the parse tree
+PDF_ANCHORS = SoupStrainer('a', href=re.compile(r'\.pdf$'))
+
+# Transient failures (rate limiting, gateway errors, dropped connections)
+# are retried with exponential backoff, honouring any Retry-After header
+RETRY_POLICY = Retry(
+    total=5,
+    backoff_factor=0.5,
+    status_forcelist=[429, 500, 502, 503, 504],
+    respect_retry_after_header=True,
+    raise_on_status=False
+)
+
+# Shared session so the scrape and all PDF downloads reuse pooled
+# keep-alive connections to fia.com instead of a new TLS handshake each
+SESSION = requests.Session()
+SESSION.mount("https://", HTTPAdapter(pool_connections=16, pool_maxsize=16, max_retries=RETRY_POLICY))
+SESSION.mount("http://", HTTPAdapter(pool_connections=16, pool_maxsize=16, max_retries=RETRY_POLICY))
 
 def ensure_directories():
     """Ensure all necessary directories exist."""
     for directory in [OUTPUT_DIR, HTML_DIR, PDF_DIR]:
         os.makedirs(directory, exist_ok=True)
 
+def write_atomic(path, content):
+    """Write text (or bytes) to a temporary file and rename it over path, so
+    an interrupted run never leaves a truncated file behind."""
+    if isinstance(content, str):
+        content = content.encode('utf-8')
+    tmp_path = path + ".tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(content)
+    os.replace(tmp_path, path)
+
+def read_json(path):
+    """Parse a JSON file, with orjson when it is installed."""
+    with open(path, 'rb') as f:
+        data = f.read()
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+def write_json(path, obj):
+    """Atomically write obj as indented JSON, with orjson when it is installed."""
+    if orjson is not None:
+        data = orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    else:
+        data = json.dumps(obj, indent=2)
+    write_atomic(path, data)
+
+def load_processed_urls():
+    """Load the set of already processed PDF URLs."""
+    if os.path.exists(PROCESSED_URLS_FILE):
+        with open(PROCESSED_URLS_FILE, 'r', encoding='utf-8') as f:
+            return set(f.read().splitlines())
+    
+    # First run after the URL list was introduced - seed it from the ledger,
+    # creating the file even when empty so later polls never parse the ledger
+    processed_urls = set(load_processed_pdfs())
+    append_processed_urls(processed_urls)
+    return processed_urls
+
+def append_processed_urls(urls):
+    """Append newly processed PDF URLs to the URL list."""
+    with open(PROCESSED_URLS_FILE, 'a', encoding='utf-8') as f:
+        f.write("".join(url + "\n" for url in urls))
+
+def encode_record(record):
+    """Encode one ledger record as a single JSON line."""
+    if orjson is not None:
+        return orjson.dumps(record) + b"\n"
+    return json.dumps(record).encode('utf-8') + b"\n"
+
 def load_processed_pdfs():
-    """Load the list of already processed PDFs."""
-    if os.path.exists(PROCESSED_FILE):
-        with open(PROCESSED_FILE, 'r') as f:
-            return json.load(f)
+    """Load the list of already processed PDFs, keyed by URL."""
+    if not os.path.exists(PROCESSED_LOG_FILE):
+        # First run with the log - migrate the old whole-file ledger
+        if not os.path.exists(PROCESSED_FILE):
+            return {}
+        processed_pdfs = read_json(PROCESSED_FILE)
+        write_atomic(PROCESSED_LOG_FILE, b"".join(encode_record(r) for r in processed_pdfs.values()))
+        return processed_pdfs
+    
+    loads = orjson.loads if orjson is not None else json.loads
+    processed_pdfs = {}
+    with open(PROCESSED_LOG_FILE, 'rb') as f:
+        for line in f:
+            try:
+                record = loads(line)
+            except ValueError:
+                # A torn last line from an interrupted run; its URL was never
+                # added to the URL list, so the PDF is simply fetched again
+                continue
+            processed_pdfs[record['url']] = record  # Later lines win
+    return processed_pdfs
+
+def append_processed_pdfs(records):
+    """Append newly processed PDFs to the ledger."""
+    with open(PROCESSED_LOG_FILE, 'ab+') as f:
+        # Terminate a torn last line so it cannot swallow the first new record
+        if f.tell() > 0:
+            f.seek(-1, os.SEEK_END)
+            if f.read(1) != b"\n":
+                f.write(b"\n")
+        f.write(b"".join(encode_record(r) for r in records.values()))
+
+def load_http_cache():
+    """Load the cached HTTP validators (ETag / Last-Modified) per URL."""
+    if os.path.exists(HTTP_CACHE_FILE):
+        return read_json(HTTP_CACHE_FILE)
     return {}
 
-def save_processed_pdfs(processed_pdfs):
-    """Save the list of processed PDFs."""
-    with open(PROCESSED_FILE, 'w') as f:
-        json.dump(processed_pdfs, f, indent=2)
+def save_http_cache(http_cache):
+    """Save the cached HTTP validators."""
+    write_json(HTTP_CACHE_FILE, http_cache)
+
+def conditional_headers(http_cache, url):
+    """Build If-None-Match / If-Modified-Since headers for a cached URL."""
+    cached = http_cache.get(url, {})
+    headers = {}
+    if cached.get('etag'):
+        headers['If-None-Match'] = cached['etag']
+    if cached.get('last_modified'):
+        headers['If-Modified-Since'] = cached['last_modified']
+    return headers
 
-def get_pdf_links():
+def remember_validators(http_cache, url, response):
+    """Record the validators a response carried so the next request can be conditional."""
+    validators = {}
+    if response.headers.get('ETag'):
+        validators['etag'] = response.headers['ETag']
+    if response.headers.get('Last-Modified'):
+        validators['last_modified'] = response.headers['Last-Modified']
+    if validators:
+        if response.headers.get('Content-Length'):
+            validators['content_length'] = response.headers['Content-Length']
+        http_cache[url] = validators
+    else:
+        http_cache.pop(url, None)
+
+def matches_cached_validators(http_cache, url, response):
+    """Check a full (non-304) response's headers against the cached validators,
+    for servers that ignore conditional request headers."""
+    cached = http_cache.get(url)
+    if not cached:
+        return False
+    if cached.get('etag'):
+        return response.headers.get('ETag') == cached['etag']
+    return (response.headers.get('Last-Modified') == cached.get('last_modified')
+            and response.headers.get('Content-Length') == cached.get('content_length'))
+
+def load_cached_links():
+    """Load the PDF links found by the last full scrape, or None."""
+    if os.path.exists(LINKS_CACHE_FILE):
+        return read_json(LINKS_CACHE_FILE)
+    return None
+
+def save_cached_links(pdf_links):
+    """Save the PDF links found by a full scrape."""
+    write_json(LINKS_CACHE_FILE, pdf_links)
+
+def get_pdf_links(http_cache):
     """Scrape the FIA website for PDF links."""
     try:
-        response = requests.get(FIA_URL)
+        # Revalidating is only useful if the links from last time are on hand
+        cached_links = load_cached_links()
+        headers = conditional_headers(http_cache, FIA_URL) if cached_links is not None else {}
+        
+        # Stream so the body is only transferred once we know it has changed
+        response = SESSION.get(FIA_URL, headers=headers, stream=True, timeout=REQUEST_TIMEOUT)
+        if response.status_code == 304:
+            logger.info("FIA documents page unchanged since last poll")
+            return refresh_dates(cached_links)
         response.raise_for_status()
+        if cached_links is not None and matches_cached_validators(http_cache, FIA_URL, response):
+            response.close()
+            logger.info("FIA documents page headers unchanged since last poll")
+            return refresh_dates(cached_links)
+        remember_validators(http_cache, FIA_URL, response)
         
-        soup = BeautifulSoup(response.text, 'html.parser')
+        # Filter to PDF links while parsing instead of walking every anchor
+        soup = BeautifulSoup(response.content, HTML_PARSER, parse_only=PDF_ANCHORS)
+        now = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
         pdf_links = []
         
-        # Find all links that might contain PDFs
-        for link in soup.find_all('a', href=True):
+        for link in soup.find_all('a'):
             href = link['href']
-            if href.endswith('.pdf'):
-                title = link.get_text().strip()
-                if not title:
-                    title = os.path.basename(href)
-                
-                pdf_links.append({
-                    'url': href if href.startswith('http') else f"https://www.fia.com{href}",
-                    'title': title,
-                    'date': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-                })
+            title = link.get_text().strip()
+            if not title:
+                title = os.path.basename(href)
+            
+            pdf_links.append({
+                'url': href if href.startswith('http') else f"https://www.fia.com{href}",
+                'title': title,
+                'date': now
+            })
         
+        save_cached_links(pdf_links)
         return pdf_links
     except Exception as e:
         logger.error(f"Error fetching PDF links: {e}")
         return []
 
-def download_pdf(url, filename):
-    """Download a PDF file."""
+def refresh_dates(pdf_links):
+    """Stamp cached links with the current time, as a fresh scrape would."""
+    now = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+    return [{**pdf_info, 'date': now} for pdf_info in pdf_links]
+
+def download_pdf(url, filename, http_cache):
+    """Download a PDF file, skipping the transfer if the local copy is current."""
     try:
-        response = requests.get(url, stream=True)
-        response.raise_for_status()
+        # Only revalidate when there is a local copy to fall back on
+        headers = conditional_headers(http_cache, url) if os.path.exists(filename) else {}
+        with SESSION.get(url, stream=True, headers=headers, timeout=REQUEST_TIMEOUT) as response:
+            if response.status_code == 304:
+                logger.info(f"PDF unchanged, keeping existing copy: {filename}")
+                return True
+            response.raise_for_status()
+            
+            # Don't stream a body that is_valid_pdf would reject anyway
+            length = response.headers.get('Content-Length')
+            if length and length.isdigit() and int(length) > MAX_PDF_SIZE:
+                logger.error(f"PDF is over the size limit ({length} bytes), skipping: {url}")
+                return False
+            
+            # Copy the socket stream straight into the file in large blocks,
+            # letting urllib3 undo any transfer encoding on the way
+            response.raw.decode_content = True
+            with open(filename, 'wb') as f:
+                shutil.copyfileobj(response.raw, f, length=DOWNLOAD_CHUNK_SIZE)
         
-        with open(filename, 'wb') as f:
-            for chunk in response.iter_content(chunk_size=8192):
-                f.write(chunk)
+        # Servers sometimes answer with an HTML error or login page - catch
+        # that here rather than letting the converters chew on it
+        if not is_valid_pdf(filename):
+            logger.error(f"Downloaded file is not a valid PDF, discarding: {url}")
+            os.remove(filename)
+            return False
         
+        remember_validators(http_cache, url, response)
         return True
     except Exception as e:
         logger.error(f"Error downloading PDF {url}: {e}")
         return False
 
-def convert_pdf_to_html(pdf_path, html_path):
-    """Convert a PDF file to HTML preserving styling and images."""
+def file_sha256(path):
+    """Hash a file's contents in large blocks."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(functools.partial(f.read, DOWNLOAD_CHUNK_SIZE), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+def download_and_hash(url, filename, http_cache):
+    """Download a PDF and return its SHA-256, or None if the download failed."""
+    if not download_pdf(url, filename, http_cache):
+        return None
+    return file_sha256(filename)
+
+def drop_from_page_cache(path):
+    """Tell the kernel a file won't be read again soon (no-op off Linux)."""
+    if not hasattr(os, 'posix_fadvise'):
+        return
     try:
-        # First try using pdf2htmlEX if available
+        fd = os.open(path, os.O_RDONLY)
         try:
-            # Check if pdf2htmlEX is installed
-            result = subprocess.run(["pdf2htmlEX", "--version"], 
-                                   stdout=subprocess.PIPE, 
-                                   stderr=subprocess.PIPE)
-            
-            # If we get here, pdf2htmlEX is installed
-            logger.info(f"Using pdf2htmlEX to convert {pdf_path}")
-            
-            # Create a temporary directory for the output
-            temp_dir = os.path.join(os.path.dirname(html_path), "temp_" + os.path.basename(html_path).replace(".html", ""))
-            os.makedirs(temp_dir, exist_ok=True)
-            
-            # Run pdf2htmlEX
-            output_filename = os.path.basename(html_path)
-            subprocess.run([
-                "pdf2htmlEX",
-                "--dest-dir", temp_dir,
-                "--zoom", "1.3",
-                "--fit-width", "1000",
-                "--embed", "cfijo",  # Embed: css, fonts, images, js, outline
-                "--process-outline", "0",
-                pdf_path,
-                output_filename
-            ], check=True)
-            
-            # Move the generated HTML file to the target location
-            temp_html_path = os.path.join(temp_dir, output_filename)
-            if os.path.exists(temp_html_path):
-                shutil.move(temp_html_path, html_path)
-                
-                # Clean up temporary directory
-                shutil.rmtree(temp_dir, ignore_errors=True)
-                
-                return True
-        except (subprocess.SubprocessError, FileNotFoundError) as e:
-            logger.warning(f"pdf2htmlEX not available or failed: {e}. Falling back to PyPDF2 + PDF.js")
-        
-        # Fallback to PyPDF2 for text extraction + PDF.js for rendering
-        import PyPDF2
-        
-        # Extract text for searchability
-        pdf_text = ""
-        with open(pdf_path, 'rb') as pdf_file:
-            pdf_reader = PyPDF2.PdfReader(pdf_file)
-            for page_num in range(len(pdf_reader.pages)):
-                page = pdf_reader.pages[page_num]
-                pdf_text += page.extract_text() + "\n\n"
-        
-        # Get filename for title
-        pdf_filename = os.path.basename(pdf_path)
-        title = pdf_filename.replace('_', ' ').replace('.pdf', '').title()
-        
-        # Create HTML with PDF.js viewer
-        html_content = f"""
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+        finally:
+            os.close(fd)
+    except OSError:
+        pass
+
+def is_valid_pdf(path):
+    """Cheap sanity check: PDF magic bytes and a plausible file size."""
+    size = os.path.getsize(path)
+    if size == 0 or size > MAX_PDF_SIZE:
+        return False
+    with open(path, 'rb') as f:
+        return f.read(5) == b'%PDF-'
+
+# Page written when the PDF text could be extracted
+VIEWER_PAGE_TEMPLATE = Template("""
         <!DOCTYPE html>
         <html lang="en">
         <head>
             <meta charset="UTF-8">
             <meta name="viewport" content="width=device-width, initial-scale=1.0">
-            <title>{title}</title>
+            <title>$title</title>
             <style>
-                body {{
+                body {
                     font-family: 'Arial', sans-serif;
                     line-height: 1.6;
                     margin: 0;
                     padding: 0;
                     color: #333;
-                }}
-                .header {{
+                }
+                .header {
                     background-color: #e10600;
                     color: white;
                     padding: 20px;
                     text-align: center;
-                }}
-                h1 {{
+                }
+                h1 {
                     margin: 0;
-                }}
-                .container {{
+                }
+                .container {
                     max-width: 1200px;
                     margin: 0 auto;
                     padding: 20px;
-                }}
-                .pdf-viewer {{
+                }
+                .pdf-viewer {
                     width: 100%;
                     height: 800px;
                     border: 1px solid #ddd;
                     margin: 20px 0;
-                }}
-                .text-content {{
+                }
+                .text-content {
                     display: none;
-                }}
-                .tabs {{
+                }
+                .tabs {
                     display: flex;
                     margin-bottom: 20px;
-                }}
-                .tab {{
+                }
+                .tab {
                     padding: 10px 20px;
                     background-color: #f2f2f2;
                     cursor: pointer;
                     border: 1px solid #ddd;
                     border-bottom: none;
                     margin-right: 5px;
-                }}
-                .tab.active {{
+                }
+                .tab.active {
                     background-color: #e10600;
                     color: white;
-                }}
-                .tab-content {{
+                }
+                .tab-content {
                     display: none;
-                }}
-                .tab-content.active {{
+                }
+                .tab-content.active {
                     display: block;
-                }}
-                footer {{
+                }
+                footer {
                     margin-top: 40px;
                     text-align: center;
                     font-size: 0.8em;
                     color: #666;
                     padding: 20px;
                     background-color: #f5f5f5;
-                }}
+                }
             </style>
         </head>
         <body>
             <div class="header">
-                <h1>{title}</h1>
+                <h1>$title</h1>
             </div>
             
             <div class="container">
@@ -227,17 +421,17 @@ def convert_pdf_to_html(pdf_path, html_path):
                 </div>
                 
                 <div id="viewer-tab" class="tab-content active">
-                    <iframe class="pdf-viewer" src="https://mozilla.github.io/pdf.js/web/viewer.html?file=../../../pdf/{pdf_filename}" width="100%" height="800px"></iframe>
+                    <iframe class="pdf-viewer" src="https://mozilla.github.io/pdf.js/web/viewer.html?file=../../../pdf/$pdf_filename" width="100%" height="800px"></iframe>
                 </div>
                 
                 <div id="text-tab" class="tab-content">
                     <div class="text-content">
-                        <pre>{pdf_text}</pre>
+                        <pre>$pdf_text</pre>
                     </div>
                 </div>
                 
                 <div style="text-align: center; margin-top: 20px;">
-                    <a href="../pdf/{pdf_filename}" download style="display: inline-block; padding: 10px 20px; background-color: #e10600; color: white; text-decoration: none; border-radius: 5px; font-weight: bold;">Download Original PDF</a>
+                    <a href="../pdf/$pdf_filename" download style="display: inline-block; padding: 10px 20px; background-color: #e10600; color: white; text-decoration: none; border-radius: 5px; font-weight: bold;">Download Original PDF</a>
                 </div>
             </div>
             
@@ -246,62 +440,54 @@ def convert_pdf_to_html(pdf_path, html_path):
             </footer>
             
             <script>
-                function switchTab(tabName) {{
+                function switchTab(tabName) {
                     // Hide all tabs
-                    document.querySelectorAll('.tab-content').forEach(tab => {{
+                    document.querySelectorAll('.tab-content').forEach(tab => {
                         tab.classList.remove('active');
-                    }});
+                    });
                     
                     // Show selected tab
                     document.getElementById(tabName + '-tab').classList.add('active');
                     
                     // Update tab buttons
-                    document.querySelectorAll('.tab').forEach(tab => {{
+                    document.querySelectorAll('.tab').forEach(tab => {
                         tab.classList.remove('active');
-                    }});
+                    });
                     
                     // Find the clicked tab button and make it active
-                    document.querySelector(`.tab[onclick="switchTab('${{tabName}}')"]`).classList.add('active');
-                }}
+                    document.querySelector(`.tab[onclick="switchTab('$${tabName}')"]`).classList.add('active');
+                }
             </script>
         </body>
         </html>
-        """
-        
-        # Write HTML to file
-        with open(html_path, 'w', encoding='utf-8') as f:
-            f.write(html_content)
-        
-        return True
-    except Exception as e:
-        logger.error(f"Error converting PDF to HTML: {e}")
-        
-        # Create a simple HTML with embedded PDF viewer as fallback
-        simple_html = f"""
+        """)
+
+# Minimal page written when conversion fails outright
+FALLBACK_PAGE_TEMPLATE = Template("""
         <!DOCTYPE html>
         <html lang="en">
         <head>
             <meta charset="UTF-8">
             <meta name="viewport" content="width=device-width, initial-scale=1.0">
-            <title>{os.path.basename(pdf_path)}</title>
+            <title>$pdf_filename</title>
             <style>
-                body {{
+                body {
                     font-family: 'Arial', sans-serif;
                     text-align: center;
                     padding: 20px;
                     max-width: 1000px;
                     margin: 0 auto;
-                }}
-                h1 {{
+                }
+                h1 {
                     color: #e10600;
-                }}
-                .pdf-container {{
+                }
+                .pdf-container {
                     margin: 20px auto;
                     border: 1px solid #ddd;
                     border-radius: 5px;
                     height: 800px;
-                }}
-                .pdf-link {{
+                }
+                .pdf-link {
                     display: inline-block;
                     margin: 20px 0;
                     padding: 10px 20px;
@@ -310,18 +496,183 @@ def convert_pdf_to_html(pdf_path, html_path):
                     text-decoration: none;
                     border-radius: 5px;
                     font-weight: bold;
-                }}
+                }
             </style>
         </head>
         <body>
-            <h1>{os.path.basename(pdf_path).replace('_', ' ').replace('.pdf', '').title()}</h1>
+            <h1>$title</h1>
             <div class="pdf-container">
-                <iframe src="https://mozilla.github.io/pdf.js/web/viewer.html?file=../../../pdf/{os.path.basename(pdf_path)}" width="100%" height="100%"></iframe>
+                <iframe src="https://mozilla.github.io/pdf.js/web/viewer.html?file=../../../pdf/$pdf_filename" width="100%" height="100%"></iframe>
             </div>
-            <p><a class="pdf-link" href="../pdf/{os.path.basename(pdf_path)}" target="_blank">Download PDF</a></p>
+            <p><a class="pdf-link" href="../pdf/$pdf_filename" target="_blank">Download PDF</a></p>
         </body>
         </html>
-        """
+        """)
+
+def import_pdfium():
+    """Return the pypdfium2 module, or None if it is not installed."""
+    try:
+        import pypdfium2 as pdfium
+    except ImportError:
+        return None
+    return pdfium
+
+def pdfium_page_texts(pdf, start, stop):
+    """Extract the text of pages start..stop-1 from an open PDFium document."""
+    pages = []
+    for index in range(start, min(stop, len(pdf))):
+        page = pdf[index]
+        text_page = page.get_textpage()
+        pages.append(text_page.get_text_range())
+        text_page.close()
+        page.close()
+    return pages
+
+def pypdf2_page_texts(pdf_reader, start, stop):
+    """Extract the text of pages start..stop-1 from an open PyPDF2 reader."""
+    stop = min(stop, len(pdf_reader.pages))
+    return [pdf_reader.pages[index].extract_text() or "" for index in range(start, stop)]
+
+def extract_page_range(pdf_path, start, stop):
+    """Extract the text of pages start..stop-1, preferring the native PDFium
+    backend. Takes only a path so it can run in a worker process."""
+    pdfium = import_pdfium()
+    if pdfium is not None:
+        pdf = pdfium.PdfDocument(pdf_path)
+        try:
+            return pdfium_page_texts(pdf, start, stop)
+        finally:
+            pdf.close()
+    
+    # Pure-Python fallback when pypdfium2 is not installed
+    import PyPDF2
+    
+    with open(pdf_path, 'rb') as pdf_file:
+        return pypdf2_page_texts(PyPDF2.PdfReader(pdf_file), start, stop)
+
+def join_page_texts(pages):
+    """Join per-page texts the way the viewer page expects them."""
+    return "".join(text + "\n\n" for text in pages)
+
+def extract_pdf_text(pdf_path, max_workers=1):
+    """Extract the text of every page. With a budget of more than one
+    worker, long documents are split into page ranges that are extracted
+    in parallel worker processes."""
+    # The page count comes from the same handle that serves the common,
+    # single-process case, so the PDF is only opened and parsed once
+    pdfium = import_pdfium()
+    if pdfium is not None:
+        pdf = pdfium.PdfDocument(pdf_path)
+        try:
+            page_count = len(pdf)
+            workers = min(max_workers, page_count // PAGES_PER_WORKER)
+            if workers < 2:
+                return join_page_texts(pdfium_page_texts(pdf, 0, page_count))
+        finally:
+            pdf.close()
+    else:
+        import PyPDF2
+        
+        with open(pdf_path, 'rb') as pdf_file:
+            pdf_reader = PyPDF2.PdfReader(pdf_file)
+            page_count = len(pdf_reader.pages)
+            workers = min(max_workers, page_count // PAGES_PER_WORKER)
+            if workers < 2:
+                return join_page_texts(pypdf2_page_texts(pdf_reader, 0, page_count))
+    
+    step = -(-page_count // workers)  # ceiling division
+    starts = range(0, page_count, step)
+    with ProcessPoolExecutor(max_workers=workers,
+                             mp_context=multiprocessing.get_context("spawn")) as executor:
+        chunks = executor.map(
+            extract_page_range,
+            [pdf_path] * len(starts),
+            starts,
+            [start + step for start in starts]
+        )
+        return join_page_texts(text for chunk in chunks for text in chunk)
+
+def render_viewer_html(pdf_path, pdf_text, html_path):
+    """Write the PDF.js viewer page for a PDF, with its extracted text."""
+    # Get filename for title
+    pdf_filename = os.path.basename(pdf_path)
+    title = pdf_filename.replace('_', ' ').replace('.pdf', '').title()
+    
+    # Create HTML with PDF.js viewer; the extracted text is untrusted markup-wise
+    html_content = VIEWER_PAGE_TEMPLATE.substitute(
+        title=html.escape(title),
+        pdf_filename=html.escape(pdf_filename),
+        pdf_text=html.escape(pdf_text, quote=False)
+    )
+    
+    # Write HTML to file
+    with open(html_path, 'w', encoding='utf-8') as f:
+        f.write(html_content)
+
+@functools.lru_cache(maxsize=1)
+def have_pdf2htmlex():
+    """Check once per process whether pdf2htmlEX is on the PATH."""
+    return shutil.which("pdf2htmlEX") is not None
+
+def convert_pdf_to_html(pdf_path, html_path, extract_workers=1):
+    """Convert a PDF file to HTML preserving styling and images.
+    extract_workers caps the processes the text fallback may fan out to."""
+    # Nothing to do if the HTML was already generated from this copy of the PDF
+    if os.path.exists(html_path) and os.path.getmtime(html_path) >= os.path.getmtime(pdf_path):
+        logger.info(f"HTML is up to date, skipping conversion: {html_path}")
+        return True
+    
+    try:
+        # First try using pdf2htmlEX if available
+        try:
+            # Check if pdf2htmlEX is installed
+            if not have_pdf2htmlex():
+                raise FileNotFoundError("pdf2htmlEX not found on PATH")
+            
+            # If we get here, pdf2htmlEX is installed
+            logger.info(f"Using pdf2htmlEX to convert {pdf_path}")
+            
+            # Create a temporary directory for the output
+            temp_dir = os.path.join(os.path.dirname(html_path), "temp_" + os.path.basename(html_path).replace(".html", ""))
+            os.makedirs(temp_dir, exist_ok=True)
+            
+            # Run pdf2htmlEX
+            output_filename = os.path.basename(html_path)
+            subprocess.run([
+                "pdf2htmlEX",
+                "--dest-dir", temp_dir,
+                "--zoom", "1.3",
+                "--fit-width", "1000",
+                "--embed", "cfijo",  # Embed: css, fonts, images, js, outline
+                "--process-outline", "0",
+                pdf_path,
+                output_filename
+            ], check=True)
+            
+            # Move the generated HTML file to the target location
+            temp_html_path = os.path.join(temp_dir, output_filename)
+            if os.path.exists(temp_html_path):
+                shutil.move(temp_html_path, html_path)
+                
+                # Clean up temporary directory
+                shutil.rmtree(temp_dir, ignore_errors=True)
+                
+                return True
+        except (subprocess.SubprocessError, FileNotFoundError) as e:
+            logger.warning(f"pdf2htmlEX not available or failed: {e}. Falling back to text extraction + PDF.js")
+        
+        # Fallback to text extraction (for searchability) + PDF.js for rendering
+        render_viewer_html(pdf_path, extract_pdf_text(pdf_path, extract_workers), html_path)
+        return True
+    except Exception as e:
+        logger.error(f"Error converting PDF to HTML: {e}")
+        
+        # Create a simple HTML with embedded PDF viewer as fallback
+        pdf_filename = os.path.basename(pdf_path)
+        simple_html = FALLBACK_PAGE_TEMPLATE.substitute(
+            title=html.escape(pdf_filename.replace('_', ' ').replace('.pdf', '').title()),
+            pdf_filename=html.escape(pdf_filename)
+        )
         
         with open(html_path, 'w', encoding='utf-8') as f:
             f.write(simple_html)
@@ -331,13 +682,20 @@ def convert_pdf_to_html(pdf_path, html_path):
 def sanitize_filename(filename):
     """Sanitize a filename to be safe for file systems."""
     # Replace any non-alphanumeric characters with underscores
-    return re.sub(r'[^\w\-\.]', '_', filename)
+    return UNSAFE_FILENAME_CHARS.sub('_', filename)
 
-def update_index_html(processed_pdfs):
-    """Update the index.html file with links to all processed PDFs."""
-    index_path = os.path.join(OUTPUT_DIR, "index.html")
-    
-    html_content = """
+# One table row of the index page, filled once per processed PDF
+INDEX_ROW_TEMPLATE = Template("""
+                <tr>
+                    <td>$title</td>
+                    <td>$date</td>
+                    <td><a href="html/$html_filename" target="_blank" class="button">View HTML</a></td>
+                    <td><a href="pdf/$pdf_filename" target="_blank" class="button">Download PDF</a></td>
+                </tr>
+        """)
+
+# Static chrome of the index page; only the rows and timestamp vary per run
+INDEX_PAGE_TEMPLATE = Template("""
     <!DOCTYPE html>
     <html lang="en">
     <head>
@@ -429,30 +787,12 @@ def update_index_html(processed_pdfs):
                 </tr>
             </thead>
             <tbody>
-    """
-    
-    # Sort by date, newest first
-    sorted_pdfs = sorted(processed_pdfs.values(), key=lambda x: x['date'], reverse=True)
-    
-    for pdf_info in sorted_pdfs:
-        html_filename = os.path.basename(pdf_info['html_path'])
-        pdf_filename = os.path.basename(pdf_info['pdf_path'])
-        
-        html_content += f"""
-                <tr>
-                    <td>{pdf_info['title']}</td>
-                    <td>{pdf_info['date']}</td>
-                    <td><a href="html/{html_filename}" target="_blank" class="button">View HTML</a></td>
-                    <td><a href="pdf/{pdf_filename}" target="_blank" class="button">Download PDF</a></td>
-                </tr>
-        """
-    
-    html_content += f"""
+    $rows
             </tbody>
         </table>
         
         <div class="last-updated">
-            Last updated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
+            Last updated: $last_updated
         </div>
         
         <footer>
@@ -460,10 +800,32 @@ def update_index_html(processed_pdfs):
         </footer>
     </body>
     </html>
-    """
+    """)
+
+def update_index_html(processed_pdfs):
+    """Update the index.html file with links to all processed PDFs."""
+    index_path = os.path.join(OUTPUT_DIR, "index.html")
     
-    with open(index_path, 'w', encoding='utf-8') as f:
-        f.write(html_content)
+    # Sort by date, newest first
+    sorted_pdfs = sorted(processed_pdfs.values(), key=lambda x: x['date'], reverse=True)
+    
+    # Collect the rows and join once rather than growing one string
+    rows = [
+        INDEX_ROW_TEMPLATE.substitute(
+            title=html.escape(pdf_info['title']),
+            date=html.escape(pdf_info['date']),
+            html_filename=html.escape(pdf_info.get('html_basename') or os.path.basename(pdf_info['html_path'])),
+            pdf_filename=html.escape(pdf_info.get('pdf_basename') or os.path.basename(pdf_info['pdf_path']))
+        )
+        for pdf_info in sorted_pdfs
+    ]
+    
+    html_content = INDEX_PAGE_TEMPLATE.substitute(
+        rows="".join(rows),
+        last_updated=datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+    )
+    
+    write_atomic(index_path, html_content)
     
     logger.info(f"Updated index.html with {len(processed_pdfs)} documents")
 
@@ -472,63 +834,179 @@ def main():
     logger.info("Starting FIA PDF monitor")
     
     ensure_directories()
-    processed_pdfs = load_processed_pdfs()
+    # Only the URL set is needed to decide what is new; the full metadata
+    # ledger is read once there is something to process or index
+    processed_urls = load_processed_urls()
+    # Validators only matter for URLs not processed yet; entries left by
+    # older runs for processed URLs are dropped so the cache stays small
+    http_cache = load_http_cache()
+    saved_http_cache = dict(http_cache)
+    for url in processed_urls.intersection(http_cache):
+        del http_cache[url]
+    processed_pdfs = None
+    converted_by_digest = {}  # SHA-256 -> HTML already generated for it
     
     try:
-        pdf_links = get_pdf_links()
+        pdf_links = get_pdf_links(http_cache)
         logger.info(f"Found {len(pdf_links)} PDF links")
         
-        new_pdfs = 0
+        new_records = {}
+        digests = {}  # URL -> SHA-256 of the downloaded PDF
+        
+        def record_result(pdf_info, pdf_path, html_path, ok):
+            """Persist one finished PDF - the ledger first, so every URL in
+            the list always has its metadata recorded."""
+            # The PDF has been read for the last time this run
+            drop_from_page_cache(pdf_path)
+            
+            if not ok:
+                return
+            
+            url = pdf_info['url']
+            logger.info(f"Converted PDF to HTML: {html_path}")
+            record = {
+                'url': url,
+                'title': pdf_info['title'],
+                'date': pdf_info['date'],
+                'pdf_path': pdf_path,
+                'html_path': html_path,
+                'pdf_basename': os.path.basename(pdf_path),
+                'html_basename': os.path.basename(html_path),
+                'sha256': digests[url]
+            }
+            append_processed_pdfs({url: record})
+            append_processed_urls([url])
+            new_records[url] = record
+            http_cache.pop(url, None)  # Never requested again
+            converted_by_digest[digests[url]] = html_path
         
+        # Collect the PDFs that still need processing
+        new_links = []
+        scheduled = set()
         for pdf_info in pdf_links:
             url = pdf_info['url']
             
-            # Skip if already processed
-            if url in processed_pdfs:
+            # Skip if already processed (or listed twice on the page)
+            if url in processed_urls or url in scheduled:
                 logger.debug(f"Skipping already processed PDF: {url}")
                 continue
+            scheduled.add(url)
+            new_links.append(pdf_info)
+        
+        # The ledger maps content hashes to existing HTML, so republished
+        # copies of a document can reuse it, and names the files already
+        # archived
+        taken = set()  # Base filenames used by the archive or this run
+        if new_links:
+            processed_pdfs = load_processed_pdfs()
+            converted_by_digest.update(
+                (record['sha256'], record['html_path'])
+                for record in processed_pdfs.values() if 'sha256' in record
+            )
+            taken.update(
+                os.path.splitext(record.get('pdf_basename') or os.path.basename(record['pdf_path']))[0]
+                for record in processed_pdfs.values()
+            )
+        
+        pending = []
+        for pdf_info in new_links:
+            logger.info(f"Processing new PDF: {pdf_info['title']} ({pdf_info['url']})")
             
-            title = pdf_info['title']
-            logger.info(f"Processing new PDF: {title} ({url})")
-            
-            # Create safe filenames
-            base_filename = sanitize_filename(os.path.splitext(os.path.basename(url))[0])
+            # Create safe filenames; a URL whose basename is already taken
+            # gets its own files, so an archived document is never
+            # overwritten and two parallel downloads never share a path
+            stem = sanitize_filename(os.path.splitext(os.path.basename(pdf_info['url']))[0])
+            base_filename = stem
+            suffix = 2
+            while base_filename in taken:
+                base_filename = f"{stem}_{suffix}"
+                suffix += 1
+            taken.add(base_filename)
             pdf_filename = f"{base_filename}.pdf"
             html_filename = f"{base_filename}.html"
             
             pdf_path = os.path.join(PDF_DIR, pdf_filename)
             html_path = os.path.join(HTML_DIR, html_filename)
             
-            # Download PDF
-            if download_pdf(url, pdf_path):
-                logger.info(f"Downloaded PDF to {pdf_path}")
-                
-                # Convert to HTML
-                if convert_pdf_to_html(pdf_path, html_path):
-                    logger.info(f"Converted PDF to HTML: {html_path}")
+            pending.append((pdf_info, pdf_path, html_path))
+        
+        # Download PDFs concurrently on a small thread pool (network-bound)
+        # and hand each one to a process pool for conversion (CPU-bound) as
+        # soon as it lands, so conversions overlap the remaining downloads.
+        # Workers are spawned rather than forked because the download
+        # threads are already running when the first conversion is queued.
+        # Each PDF is recorded as soon as it and every PDF listed before it
+        # are finished, so an interrupted run keeps its completed work and
+        # the ledger is still written in listing order.
+        # The pool already runs one conversion per CPU, so a conversion may
+        # only fan its page ranges out to the CPUs its siblings leave idle
+        extract_workers = max(1, (os.cpu_count() or 1) // max(1, len(pending)))
+        with ThreadPoolExecutor(max_workers=DOWNLOAD_WORKERS) as download_pool, \
+                ProcessPoolExecutor(max_workers=os.cpu_count(),
+                                    mp_context=multiprocessing.get_context("spawn")) as convert_pool:
+            downloads = {
+                download_pool.submit(download_and_hash, pdf_info['url'], pdf_path, http_cache): index
+                for index, (pdf_info, pdf_path, html_path) in enumerate(pending)
+            }
+            conversions = {}
+            finished = {}  # Listing index -> conversion succeeded
+            next_index = 0
+            in_flight = set(downloads)
+            
+            while in_flight:
+                done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    if future in conversions:
+                        index = conversions[future]
+                        ok = future.result()
+                        if not ok:
+                            logger.error(f"Failed to convert PDF to HTML: {pending[index][1]}")
+                        finished[index] = ok
+                        continue
+                    
+                    index = downloads[future]
+                    pdf_info, pdf_path, html_path = pending[index]
                     
-                    # Record as processed
-                    processed_pdfs[url] = {
-                        'url': url,
-                        'title': title,
-                        'date': pdf_info['date'],
-                        'pdf_path': pdf_path,
-                        'html_path': html_path
-                    }
+                    digest = future.result()
+                    if digest is None:
+                        logger.error(f"Failed to download PDF: {pdf_info['url']}")
+                        finished[index] = False
+                        continue
                     
-                    new_pdfs += 1
-                else:
-                    logger.error(f"Failed to convert PDF to HTML: {pdf_path}")
-            else:
-                logger.error(f"Failed to download PDF: {url}")
+                    logger.info(f"Downloaded PDF to {pdf_path}")
+                    digests[pdf_info['url']] = digest
+                    
+                    # The same document republished under another URL
+                    # reuses the HTML already generated for it
+                    cached_html = converted_by_digest.get(digest)
+                    if cached_html and cached_html != html_path and os.path.exists(cached_html):
+                        logger.info(f"Identical PDF already converted, copying {cached_html}")
+                        shutil.copyfile(cached_html, html_path)
+                        finished[index] = True
+                        continue
+                    
+                    conversion = convert_pool.submit(convert_pdf_to_html, pdf_path, html_path, extract_workers)
+                    conversions[conversion] = index
+                    in_flight.add(conversion)
+                
+                while next_index in finished:
+                    record_result(*pending[next_index], finished.pop(next_index))
+                    next_index += 1
         
-        # Save processed PDFs
-        save_processed_pdfs(processed_pdfs)
+        # An idle poll whose listing page was unchanged writes nothing
+        if http_cache != saved_http_cache:
+            save_http_cache(http_cache)
         
-        # Update index.html
-        update_index_html(processed_pdfs)
+        # Update index.html - its rows only change when something was added
+        if new_records or not os.path.exists(os.path.join(OUTPUT_DIR, "index.html")):
+            if processed_pdfs is None:
+                processed_pdfs = load_processed_pdfs()
+            processed_pdfs.update(new_records)
+            update_index_html(processed_pdfs)
+        else:
+            logger.info("No new PDFs, leaving index.html as is")
         
-        logger.info(f"Processed {new_pdfs} new PDFs")
+        logger.info(f"Processed {len(new_records)} new PDFs")
     
     except Exception as e:
         logger.error(f"Error in main function: {e}")
@@ -0,0 +1,221 @@
+import os
+import re
+from datetime import datetime
+from html import escape, unescape
+from string import Template
+
+from _jsonio import read_json, write_json
+
+TITLE_PATTERN = re.compile(rb'<title[^>]*>(.*?)</title>', re.DOTALL)
+
+TITLE_READ_LIMIT = 16384  # A <title> further into the file than this isn't looked for
+
+def extract_title(path, block_size=4096):
+    """Read an HTML file only as far as its </title> and return the title"""
+    buf = bytearray()
+    # Unbuffered, so each block costs one read() syscall and nothing more is read ahead
+    with open(path, 'rb', buffering=0) as f:
+        while len(buf) < TITLE_READ_LIMIT:
+            block = f.read(block_size)
+            if not block:
+                return None
+            # Only the new block (plus a tag's worth of overlap) needs searching
+            start = max(len(buf) - len(b'</title>'), 0)
+            buf += block
+            if buf.find(b'</title>', start) != -1:
+                break
+    match = TITLE_PATTERN.search(buf)
+    return match.group(1).decode('utf-8', 'replace').strip() if match else None
+
+TITLE_CACHE_FILE = ".index_cache.json"  # Titles from earlier runs, in the output dir
+
+def load_title_cache(path):
+    """Load titles extracted on earlier runs, keyed by relative path"""
+    try:
+        return read_json(path)
+    except (OSError, ValueError):
+        return {}
+
+def save_title_cache(path, titles):
+    """Save the titles extracted on this run"""
+    write_json(path, titles, indent=False)
+
+def iter_html_files(directory):
+    """Yield (path, stat) for every page under directory except index.html"""
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                yield from iter_html_files(entry.path)
+            elif entry.name.endswith('.html') and entry.name != 'index.html':
+                yield entry.path, entry.stat()
+
+def find_html_files(output_dir, known_titles=None):
+    """Find all HTML files in the output directory and its subdirectories"""
+    html_files = []
+    known_titles = known_titles or {}
+
+    # Only files that changed since the last run need to be opened
+    cache_path = os.path.join(output_dir, TITLE_CACHE_FILE)
+    cached_titles = load_title_cache(cache_path)
+    titles = {}
+
+    # Find all HTML files in the output directory and its subdirectories
+    for full_path, st in iter_html_files(output_dir):
+        relative_path = os.path.relpath(full_path, output_dir)
+
+        cached = cached_titles.get(relative_path)
+        if relative_path in known_titles:
+            title = known_titles[relative_path]
+        elif cached and cached['mtime_ns'] == st.st_mtime_ns and cached['size'] == st.st_size:
+            title = cached['title']
+        else:
+            # Try to extract a title from the HTML file
+            title = os.path.splitext(os.path.basename(full_path))[0]
+            try:
+                title = extract_title(full_path) or title
+            except Exception:
+                pass  # Use the filename as title if extraction fails
+        titles[relative_path] = {'mtime_ns': st.st_mtime_ns, 'size': st.st_size, 'title': title}
+
+        # Get the file's modification time as the date
+        date = datetime.fromtimestamp(st.st_mtime).strftime('%Y-%m-%d')
+
+        html_files.append({
+            'path': relative_path,
+            'title': unescape(title),  # <title> holds markup, the list wants text
+            'date': date
+        })
+
+    save_title_cache(cache_path, titles)
+
+    # Sort by date (newest first)
+    html_files.sort(key=lambda x: x['date'], reverse=True)
+    return html_files
+
+# Page chrome of the archive index; only the timestamp and list vary
+ROOT_INDEX_PAGE_TEMPLATE = Template("""<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>FIA Documents Archive</title>
+    <style>
+        body {
+            font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
+            max-width: 1000px;
+            margin: 0 auto;
+            padding: 20px;
+            background-color: #f5f5f5;
+            color: #333;
+        }
+        header {
+            background-color: #e10600;
+            color: white;
+            padding: 20px;
+            border-radius: 5px;
+            margin-bottom: 20px;
+            box-shadow: 0 2px 5px rgba(0,0,0,0.1);
+        }
+        h1 {
+            margin: 0;
+            font-size: 2em;
+        }
+        .last-updated {
+            margin-top: 10px;
+            font-size: 0.9em;
+            opacity: 0.8;
+        }
+        .document-list {
+            list-style-type: none;
+            padding: 0;
+        }
+        .document-item {
+            background-color: white;
+            margin-bottom: 15px;
+            padding: 15px;
+            border-radius: 5px;
+            box-shadow: 0 2px 5px rgba(0,0,0,0.05);
+            transition: transform 0.2s, box-shadow 0.2s;
+        }
+        .document-item:hover {
+            transform: translateY(-2px);
+            box-shadow: 0 4px 8px rgba(0,0,0,0.1);
+        }
+        .document-link {
+            color: #0066cc;
+            text-decoration: none;
+            font-weight: 500;
+            font-size: 1.1em;
+            display: block;
+            margin-bottom: 5px;
+        }
+        .document-link:hover {
+            text-decoration: underline;
+        }
+        .document-date {
+            color: #666;
+            font-size: 0.9em;
+        }
+        .no-documents {
+            background-color: white;
+            padding: 20px;
+            border-radius: 5px;
+            text-align: center;
+            color: #666;
+        }
+        footer {
+            margin-top: 30px;
+            text-align: center;
+            font-size: 0.9em;
+            color: #666;
+        }
+    </style>
+</head>
+<body>
+    <header>
+        <h1>FIA Documents Archive</h1>
+        <div class="last-updated">Last updated: $date</div>
+    </header>
+
+    $content
+
+    <footer>
+        <p>This archive is automatically updated with the latest documents from the FIA website.</p>
+    </footer>
+</body>
+</html>
+""")
+
+def create_root_index(output_dir, entries=None):
+    """Create an index.html file in the root directory"""
+    # Pages converted on this run already know their titles, so they aren't read back
+    known_titles = {}
+    for entry in entries or ():
+        if entry.get("success") and entry.get("html_title") is not None:
+            # Stored the way it appears in the page's <title>, like the title cache
+            known_titles[os.path.relpath(entry["html_path"], output_dir)] = escape(entry["html_title"])
+
+    html_files = find_html_files(output_dir, known_titles)
+
+    if html_files:
+        # Generate list items for each HTML file
+        items = []
+        for file in html_files:
+            items.append(f'        <li class="document-item">\n            <a href="{escape(file["path"])}" class="document-link">{escape(file["title"])}</a>\n            <span class="document-date">{file["date"]}</span>\n        </li>')
+
+        content = f'    <ul class="document-list">\n{"".join(items)}\n    </ul>'
+    else:
+        content = '    <div class="no-documents">No documents available yet.</div>'
+
+    # Fill in the template
+    html_content = ROOT_INDEX_PAGE_TEMPLATE.substitute(
+        date=datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        content=content
+    )
+
+    # Write the index page to the root directory
+    index_path = os.path.join(output_dir, "index.html")
+    with open(index_path, "w", encoding="utf-8") as f:
+        f.write(html_content)
+
+    return index_path
@@ -0,0 +1,26 @@
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def loads(data):
+    """Parse JSON text or bytes, with orjson when it is installed"""
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+def dumps(obj, indent=False):
+    """Serialize obj to JSON bytes, with orjson when it is installed"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(obj, indent=2 if indent else None).encode('utf-8')
+
+def read_json(path):
+    """Parse a JSON file"""
+    with open(path, 'rb') as f:
+        return loads(f.read())
+
+def write_json(path, obj, indent=True):
+    """Write obj as JSON"""
+    with open(path, 'wb') as f:
+        f.write(dumps(obj, indent))
@@ -1,20 +1,101 @@
 import os
-import json
 import requests
+from requests.adapters import HTTPAdapter
 import subprocess
 import shutil
+import gzip
+import hashlib
+import tempfile
 from datetime import datetime
 import time
+from html import escape
+from string import Template
+from concurrent.futures import ThreadPoolExecutor
+
+from _indexing import create_root_index
+from _jsonio import read_json, write_json
+
+try:
+    from lxml import etree
+    HAVE_LXML = True
+except ImportError:
+    import xml.etree.ElementTree as etree
+    HAVE_LXML = False
+
+try:
+    # Streams the multipart body from disk instead of building it in memory
+    from requests_toolbelt.multipart.encoder import MultipartEncoder
+except ImportError:
+    MultipartEncoder = None
 
 # Configuration
 OUTPUT_DIR = "docs"  # Changed from "output/html" to "docs" for GitHub Pages
 GROBID_URL = "http://localhost:8070"  # GROBID service URL when running locally
+# Concurrent requests to GROBID; keep this at or below the service's own
+# concurrency setting, past which it answers 503
+GROBID_WORKERS = int(os.environ.get("GROBID_WORKERS", 4))
+GROBID_STARTUP_TIMEOUT = 60  # Seconds to wait for GROBID to come up
+GROBID_TIMEOUT = (5, 300)  # Connect/read timeout for a single conversion
+TEI_NS = {'tei': 'http://www.tei-c.org/ns/1.0'}  # GROBID output is namespaced
+TEI_CACHE_DIR = os.path.join(".cache", "tei")  # GROBID output keyed by PDF content hash
+
+# Shared session so the health checks and every GROBID request reuse
+# pooled keep-alive connections instead of reconnecting per PDF
+SESSION = requests.Session()
+SESSION.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=16))
 
 def ensure_dir(directory):
     """Ensure the directory exists"""
     if not os.path.exists(directory):
         os.makedirs(directory)
 
+def pdf_digest(path):
+    """Content hash of a PDF, used to key the TEI cache"""
+    digest = hashlib.blake2b(digest_size=16)
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+def process_with_grobid(pdf_path):
+    """Return GROBID's TEI for a PDF, reusing the cached result for identical files"""
+    cache_path = os.path.join(TEI_CACHE_DIR, f"{pdf_digest(pdf_path)}.tei.xml.gz")
+    if os.path.exists(cache_path):
+        with gzip.open(cache_path, 'rt', encoding='utf-8') as f:
+            return f.read()
+
+    # Call GROBID API to process the full text
+    with open(pdf_path, 'rb') as pdf:
+        fields = {'consolidateHeader': '1', 'includeRawCitations': '1'}
+        upload = (os.path.basename(pdf_path), pdf, 'application/pdf')
+        if MultipartEncoder is not None:
+            encoder = MultipartEncoder({**fields, 'input': upload})
+            response = SESSION.post(
+                f"{GROBID_URL}/api/processFulltextDocument",
+                data=encoder,
+                headers={'Content-Type': encoder.content_type},
+                timeout=GROBID_TIMEOUT
+            )
+        else:
+            response = SESSION.post(
+                f"{GROBID_URL}/api/processFulltextDocument",
+                files={'input': upload},
+                data=fields,
+                timeout=GROBID_TIMEOUT
+            )
+
+    if response.status_code != 200:
+        raise Exception(f"GROBID API returned status code {response.status_code}")
+
+    # Publish the cache entry atomically; another thread may be writing the same one
+    os.makedirs(TEI_CACHE_DIR, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=TEI_CACHE_DIR, suffix=".tmp")
+    with os.fdopen(fd, 'wb') as raw, gzip.open(raw, 'wt', encoding='utf-8') as f:
+        f.write(response.text)
+    os.replace(tmp_path, cache_path)
+
+    return response.text
+
 def convert_pdf_to_html_with_grobid(pdf_path, output_dir):
     """Convert a PDF to HTML using GROBID"""
     pdf_name = os.path.splitext(os.path.basename(pdf_path))[0]
@@ -25,35 +106,26 @@ def convert_pdf_to_html_with_grobid(pdf_path, output_dir):
     html_file = os.path.join(html_dir, f"{pdf_name}.html")
 
     try:
-        # Call GROBID API to process the PDF
-        with open(pdf_path, 'rb') as pdf:
-            # First, process the full text
-            response = requests.post(
-                f"{GROBID_URL}/api/processFulltextDocument",
-                files={'input': pdf},
-                data={'consolidateHeader': '1', 'includeRawCitations': '1'}
-            )
-
-            if response.status_code != 200:
-                raise Exception(f"GROBID API returned status code {response.status_code}")
+        tei_content = process_with_grobid(pdf_path)
 
-            # Save the TEI XML response
-            tei_file = os.path.join(html_dir, f"{pdf_name}.tei.xml")
-            with open(tei_file, 'w', encoding='utf-8') as f:
-                f.write(response.text)
+        # Save the TEI XML response
+        tei_file = os.path.join(html_dir, f"{pdf_name}.tei.xml")
+        with open(tei_file, 'w', encoding='utf-8') as f:
+            f.write(tei_content)
 
-            # Convert TEI to HTML
-            html_content = tei_to_html(response.text, pdf_name)
+        # Convert TEI to HTML
+        html_content = tei_to_html(tei_content, pdf_name)
 
-            # Save the HTML
-            with open(html_file, 'w', encoding='utf-8') as f:
-                f.write(html_content)
+        # Save the HTML
+        with open(html_file, 'w', encoding='utf-8') as f:
+            f.write(html_content)
 
-            return {
-                "html_path": html_file,
-                "html_dir": html_dir,
-                "success": True
-            }
+        return {
+            "html_path": html_file,
+            "html_dir": html_dir,
+            "html_title": pdf_name,
+            "success": True
+        }
     except Exception as e:
         print(f"Error converting {pdf_path}: {str(e)}")
         return {
@@ -61,92 +133,166 @@ def convert_pdf_to_html_with_grobid(pdf_path, output_dir):
             "error": str(e)
         }
 
-def tei_to_html(tei_content, title):
-    """Convert TEI XML to HTML"""
-    # This is a simplified conversion - in a real implementation,
-    # you would use a proper XML parser and create a more sophisticated HTML output
-
-    # Basic HTML template
-    html_template = """<!DOCTYPE html>
+TEI_PAGE_TEMPLATE = Template("""<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{title}</title>
+    <title>$title</title>
     <style>
-        body {{ font-family: Arial, sans-serif; line-height: 1.6; max-width: 800px; margin: 0 auto; padding: 20px; }}
-        h1, h2, h3 {{ color: #333; }}
-        .abstract {{ background-color: #f9f9f9; padding: 15px; border-left: 4px solid #ddd; margin-bottom: 20px; }}
-        .section {{ margin-bottom: 20px; }}
-        .figure {{ text-align: center; margin: 20px 0; }}
-        .figure img {{ max-width: 100%; }}
-        .table {{ width: 100%; border-collapse: collapse; margin: 20px 0; }}
-        .table th, .table td {{ border: 1px solid #ddd; padding: 8px; }}
-        .table th {{ background-color: #f2f2f2; }}
-        .reference {{ margin-bottom: 10px; padding-left: 20px; text-indent: -20px; }}
+        body { font-family: Arial, sans-serif; line-height: 1.6; max-width: 800px; margin: 0 auto; padding: 20px; }
+        h1, h2, h3 { color: #333; }
+        .abstract { background-color: #f9f9f9; padding: 15px; border-left: 4px solid #ddd; margin-bottom: 20px; }
+        .section { margin-bottom: 20px; }
+        .figure { text-align: center; margin: 20px 0; }
+        .figure img { max-width: 100%; }
+        .table { width: 100%; border-collapse: collapse; margin: 20px 0; }
+        .table th, .table td { border: 1px solid #ddd; padding: 8px; }
+        .table th { background-color: #f2f2f2; }
+        .reference { margin-bottom: 10px; padding-left: 20px; text-indent: -20px; }
     </style>
 </head>
 <body>
-    <h1>{title}</h1>
+    <h1>$title</h1>
     <div class="content">
-{content}
+$content
     </div>
 </body>
 </html>
-"""
+""")
+
+def tei_text(elem):
+    """Return the escaped text of a TEI element with whitespace collapsed"""
+    return escape(" ".join("".join(elem.itertext()).split()))
+
+def tei_tag(elem):
+    """Return an element's tag without its namespace, or None for comments
+    and processing instructions"""
+    if not isinstance(elem.tag, str):
+        return None
+    return elem.tag.rpartition('}')[2]
+
+def tei_table_html(table, caption=None):
+    """Render a TEI <table> as an HTML table of its rows and cells"""
+    parts = ['<table class="table">']
+    if caption:
+        parts.append(f'<caption>{caption}</caption>')
+    for row in table.iter():
+        if tei_tag(row) != 'row':
+            continue
+        # GROBID marks header rows with role="label"
+        cell_tag = 'th' if row.get('role') == 'label' else 'td'
+        cells = "".join(
+            f'<{cell_tag}>{tei_text(cell)}</{cell_tag}>'
+            for cell in row if tei_tag(cell) == 'cell'
+        )
+        parts.append(f'<tr>{cells}</tr>')
+    parts.append('</table>')
+    return "\n".join(parts)
+
+def tei_figure_html(figure):
+    """Render a TEI <figure>; tables keep their rows, anything else its text"""
+    tables = [elem for elem in figure.iter() if tei_tag(elem) == 'table']
+    if not tables:
+        text = tei_text(figure)
+        return f'<p>{text}</p>' if text else ""
+    head = next((child for child in figure if tei_tag(child) == 'head'), None)
+    caption = tei_text(head) if head is not None else None
+    return "\n".join(tei_table_html(table, caption if i == 0 else None) for i, table in enumerate(tables))
+
+def tei_blocks_html(elem, level=2, div_level=3):
+    """Render the block-level children of a TEI <body> or <div>. Nested
+    divs become nested sections; an element with no dedicated rendering
+    keeps its text as a paragraph rather than being dropped."""
+    parts = []
+    for child in elem:
+        tag = tei_tag(child)
+        if tag is None:
+            continue
+        if tag == 'head':
+            parts.append(f'<h{level}>{tei_text(child)}</h{level}>')
+        elif tag == 'div':
+            parts.append(tei_section_html(child, div_level))
+        elif tag == 'figure':
+            parts.append(tei_figure_html(child))
+        elif tag == 'table':
+            parts.append(tei_table_html(child))
+        else:
+            text = tei_text(child)
+            if text:
+                parts.append(f'<p>{text}</p>')
+    return [part for part in parts if part]
 
-    # Extract content from TEI
-    # This is a very simplified extraction - a real implementation would be more thorough
-    import re
-    from html import escape
+def tei_section_html(div, level=2):
+    """Render a TEI <div> as an HTML section"""
+    blocks = tei_blocks_html(div, level, min(level + 1, 3))
+    return "\n".join(['<div class="section">', *blocks, '</div>'])
+
+def tei_to_html(tei_content, title):
+    """Convert TEI XML to HTML"""
+    # Parse the TEI once; the XML declaration requires bytes input. lxml
+    # can recover from the occasional malformed GROBID output and lift its
+    # size limits for very long documents. A parser is made per call
+    # because conversions run on several threads.
+    parser = etree.XMLParser(recover=True, huge_tree=True) if HAVE_LXML else None
+    root = etree.fromstring(tei_content.encode('utf-8'), parser=parser)
 
     # Extract title if not provided
     if not title:
-        title_match = re.search(r'<title[^>]*>(.*?)</title>', tei_content, re.DOTALL)
-        if title_match:
-            title = title_match.group(1).strip()
-        else:
+        title = (root.findtext('.//tei:titleStmt/tei:title', namespaces=TEI_NS) or "").strip()
+        if not title:
             title = "Converted Document"
 
-    # Extract abstract
-    abstract = ""
-    abstract_match = re.search(r'<abstract>(.*?)</abstract>', tei_content, re.DOTALL)
-    if abstract_match:
-        abstract = f'<div class="abstract"><h2>Abstract</h2>{abstract_match.group(1)}</div>'
-
-    # Extract body text
-    body_content = ""
-    body_match = re.search(r'<body>(.*?)</body>', tei_content, re.DOTALL)
-    if body_match:
-        body_text = body_match.group(1)
-
-        # Convert sections
-        body_text = re.sub(r'<div[^>]*type="section"[^>]*>', '<div class="section">', body_text)
-
-        # Convert headings
-        body_text = re.sub(r'<head>(.*?)</head>', r'<h2>\1</h2>', body_text)
+    parts = []
 
-        # Convert paragraphs
-        body_text = re.sub(r'<p>(.*?)</p>', r'<p>\1</p>', body_text)
+    # Extract abstract
+    abstract = root.find('.//tei:profileDesc/tei:abstract', TEI_NS)
+    if abstract is not None:
+        paragraphs = "".join(f'<p>{tei_text(p)}</p>' for p in abstract.iterfind('.//tei:p', TEI_NS))
+        parts.append(f'<div class="abstract"><h2>Abstract</h2>{paragraphs}</div>')
 
-        body_content = body_text
+    # Extract body sections, tables and any loose paragraphs
+    body = root.find('.//tei:text/tei:body', TEI_NS)
+    if body is not None:
+        parts.extend(tei_blocks_html(body, div_level=2))
 
     # Combine content
-    content = abstract + body_content
-
-    # Clean up XML tags that we don't want in HTML
-    content = re.sub(r'<[/]?(tei|text|TEI|div)[^>]*>', '', content)
+    content = "\n".join(parts)
 
     # Fill template
-    html_content = html_template.format(
+    html_content = TEI_PAGE_TEMPLATE.substitute(
         title=escape(title),
         content=content
     )
 
     return html_content
 
+def grobid_is_alive(timeout=2):
+    """Return True if the GROBID health endpoint answers"""
+    try:
+        return SESSION.get(f"{GROBID_URL}/api/isalive", timeout=timeout).status_code == 200
+    except requests.RequestException:
+        return False
+
+def wait_for_grobid(timeout=GROBID_STARTUP_TIMEOUT, min_interval=0.25, max_interval=4):
+    """Poll the GROBID health endpoint until it answers or the timeout expires"""
+    deadline = time.monotonic() + timeout
+    interval = min_interval
+    while time.monotonic() < deadline:
+        if grobid_is_alive():
+            return True
+        # Back off, but never sleep past the deadline
+        time.sleep(max(min(interval, deadline - time.monotonic()), 0))
+        interval = min(interval * 2, max_interval)
+    return False
+
 def start_grobid_docker():
     """Start GROBID Docker container if not already running"""
+    # A service that already answers (e.g. a CI service container) needs no docker calls
+    if grobid_is_alive(timeout=0.5):
+        print("GROBID is already running")
+        return
+
     try:
         # Check if GROBID container is already running
         result = subprocess.run(
@@ -160,23 +306,15 @@ def start_grobid_docker():
                 ["docker", "run", "--rm", "-d", "--name", "grobid", "-p", "8070:8070", "lfoppiano/grobid:0.7.2"],
                 check=True
             )
-
-            # Wait for GROBID to start
-            print("Waiting for GROBID to start...")
-            max_retries = 10
-            for i in range(max_retries):
-                try:
-                    response = requests.get(f"{GROBID_URL}/api/isalive")
-                    if response.status_code == 200:
-                        print("GROBID is ready!")
-                        break
-                except:
-                    pass
-
-                print(f"Waiting for GROBID to start (attempt {i+1}/{max_retries})...")
-                time.sleep(5)
         else:
             print("GROBID Docker container is already running")
+
+        # Wait for GROBID to start
+        print("Waiting for GROBID to start...")
+        if wait_for_grobid():
+            print("GROBID is ready!")
+        else:
+            print(f"GROBID did not become ready within {GROBID_STARTUP_TIMEOUT}s")
     except Exception as e:
         print(f"Error starting GROBID Docker container: {str(e)}")
         print("Please make sure Docker is installed and running")
@@ -192,31 +330,36 @@ def convert_pdfs():
     # Start GROBID Docker container
     start_grobid_docker()
 
-    with open("downloaded_pdfs.json", "r") as f:
-        downloaded_pdfs = json.load(f)
+    downloaded_pdfs = read_json("downloaded_pdfs.json")
 
-    converted_pdfs = []
+    pdfs_to_convert = []
     for pdf_info in downloaded_pdfs:
         if "local_path" in pdf_info and os.path.exists(pdf_info["local_path"]):
-            print(f"Converting {pdf_info['local_path']} to HTML")
-            result = convert_pdf_to_html_with_grobid(pdf_info["local_path"], OUTPUT_DIR)
-
-            # Merge the conversion result with the original PDF info
-            converted_pdf = {**pdf_info, **result}
-            converted_pdfs.append(converted_pdf)
+            pdfs_to_convert.append(pdf_info)
         else:
             print(f"PDF file not found: {pdf_info.get('local_path', 'unknown')}")
 
+    def convert(pdf_info):
+        print(f"Converting {pdf_info['local_path']} to HTML")
+        return convert_pdf_to_html_with_grobid(pdf_info["local_path"], OUTPUT_DIR)
+
+    # GROBID serves requests concurrently, so keep several in flight
+    with ThreadPoolExecutor(max_workers=GROBID_WORKERS) as executor:
+        results = list(executor.map(convert, pdfs_to_convert))
+
+    # Merge the conversion results with the original PDF info
+    converted_pdfs = [{**pdf_info, **result} for pdf_info, result in zip(pdfs_to_convert, results)]
+
     # Create an index page
     if converted_pdfs:
         create_index_page(converted_pdfs, OUTPUT_DIR)
 
     # Save the conversion results
-    with open("converted_pdfs.json", "w") as f:
-        json.dump(converted_pdfs, f, indent=2)
+    write_json("converted_pdfs.json", converted_pdfs)
 
     # Create a root index.html file for GitHub Pages
-    create_root_index(OUTPUT_DIR)
+    index_path = create_root_index(OUTPUT_DIR, entries=converted_pdfs)
+    print(f"Created improved index page at {index_path}")
     
     # Create a .nojekyll file to disable Jekyll processing on GitHub Pages
     nojekyll_path = os.path.join(OUTPUT_DIR, ".nojekyll")
@@ -227,36 +370,35 @@ def convert_pdfs():
     return converted_pdfs
 
 
-def create_index_page(converted_pdfs, output_dir):
-    """Create an index.html page that lists all converted PDFs"""
-    index_path = os.path.join(output_dir, "index.html")
-
-    # Simple HTML template for the index page
-    html_content = """<!DOCTYPE html>
+INDEX_PAGE_TEMPLATE = Template("""<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>FIA Documents</title>
     <style>
-        body {{ font-family: Arial, sans-serif; max-width: 800px; margin: 0 auto; padding: 20px; }}
-        h1 {{ color: #333; }}
-        ul {{ list-style-type: none; padding: 0; }}
-        li {{ margin-bottom: 10px; padding: 10px; border-bottom: 1px solid #eee; }}
-        a {{ color: #0066cc; text-decoration: none; }}
-        a:hover {{ text-decoration: underline; }}
-        .date {{ color: #666; font-size: 0.8em; }}
+        body { font-family: Arial, sans-serif; max-width: 800px; margin: 0 auto; padding: 20px; }
+        h1 { color: #333; }
+        ul { list-style-type: none; padding: 0; }
+        li { margin-bottom: 10px; padding: 10px; border-bottom: 1px solid #eee; }
+        a { color: #0066cc; text-decoration: none; }
+        a:hover { text-decoration: underline; }
+        .date { color: #666; font-size: 0.8em; }
     </style>
 </head>
 <body>
     <h1>FIA Documents</h1>
-    <p>Last updated: {date}</p>
+    <p>Last updated: $date</p>
     <ul>
-{items}
+$items
     </ul>
 </body>
 </html>
-"""
+""")
+
+def create_index_page(converted_pdfs, output_dir):
+    """Create an index.html page that lists all converted PDFs"""
+    index_path = os.path.join(output_dir, "index.html")
 
     # Generate list items for each converted PDF
     items = []
@@ -265,10 +407,10 @@ def create_index_page(converted_pdfs, output_dir):
             relative_path = os.path.relpath(pdf["html_path"], output_dir)
             title = pdf.get("title", os.path.basename(relative_path))
             date = pdf.get("date", "Unknown date")
-            items.append(f'        <li><a href="{relative_path}">{title}</a> <span class="date">{date}</span></li>')
+            items.append(f'        <li><a href="{escape(relative_path)}">{escape(title)}</a> <span class="date">{escape(date)}</span></li>')
 
     # Fill in the template
-    html_content = html_content.format(
+    html_content = INDEX_PAGE_TEMPLATE.substitute(
         date=datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
         items="\n".join(items)
     )
@@ -279,157 +421,6 @@ def create_index_page(converted_pdfs, output_dir):
 
     return index_path
 
-def create_root_index(output_dir):
-    """Create an improved index.html file in the root directory for GitHub Pages"""
-    # Find all HTML files in the output directory
-    html_files = []
-    for root, _, files in os.walk(output_dir):
-        for file in files:
-            if file.endswith('.html') and file != 'index.html':
-                full_path = os.path.join(root, file)
-                relative_path = os.path.relpath(full_path, output_dir)
-
-                # Try to extract a title from the HTML file
-                title = os.path.splitext(os.path.basename(file))[0]
-                try:
-                    with open(full_path, 'r', encoding='utf-8') as f:
-                        content = f.read()
-                        title_match = content.split('<title>')[1].split('</title>')[0] if '<title>' in content else title
-                        title = title_match.strip()
-                except Exception:
-                    pass  # Use the filename as title if extraction fails
-
-                # Get the file's modification time as the date
-                mod_time = os.path.getmtime(full_path)
-                date = datetime.fromtimestamp(mod_time).strftime('%Y-%m-%d')
-
-                html_files.append({
-                    'path': relative_path,
-                    'title': title,
-                    'date': date
-                })
-
-    # Sort by date (newest first)
-    html_files.sort(key=lambda x: x['date'], reverse=True)
-
-    # HTML template with improved styling - properly escaped curly braces for CSS
-    html_template = """<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>FIA Documents Archive</title>
-    <style>
-        body {{
-            font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
-            max-width: 1000px;
-            margin: 0 auto;
-            padding: 20px;
-            background-color: #f5f5f5;
-            color: #333;
-        }}
-        header {{
-            background-color: #e10600;
-            color: white;
-            padding: 20px;
-            border-radius: 5px;
-            margin-bottom: 20px;
-            box-shadow: 0 2px 5px rgba(0,0,0,0.1);
-        }}
-        h1 {{
-            margin: 0;
-            font-size: 2em;
-        }}
-        .last-updated {{
-            margin-top: 10px;
-            font-size: 0.9em;
-            opacity: 0.8;
-        }}
-        .document-list {{
-            list-style-type: none;
-            padding: 0;
-        }}
-        .document-item {{
-            background-color: white;
-            margin-bottom: 15px;
-            padding: 15px;
-            border-radius: 5px;
-            box-shadow: 0 2px 5px rgba(0,0,0,0.05);
-            transition: transform 0.2s, box-shadow 0.2s;
-        }}
-        .document-item:hover {{
-            transform: translateY(-2px);
-            box-shadow: 0 4px 8px rgba(0,0,0,0.1);
-        }}
-        .document-link {{
-            color: #0066cc;
-            text-decoration: none;
-            font-weight: 500;
-            font-size: 1.1em;
-            display: block;
-            margin-bottom: 5px;
-        }}
-        .document-link:hover {{
-            text-decoration: underline;
-        }}
-        .document-date {{
-            color: #666;
-            font-size: 0.9em;
-        }}
-        .no-documents {{
-            background-color: white;
-            padding: 20px;
-            border-radius: 5px;
-            text-align: center;
-            color: #666;
-        }}
-        footer {{
-            margin-top: 30px;
-            text-align: center;
-            font-size: 0.9em;
-            color: #666;
-        }}
-    </style>
-</head>
-<body>
-    <header>
-        <h1>FIA Documents Archive</h1>
-        <div class="last-updated">Last updated: {date}</div>
-    </header>
-
-    {content}
-
-    <footer>
-        <p>This archive is automatically updated with the latest documents from the FIA website.</p>
-    </footer>
-</body>
-</html>
-"""
-
-    if html_files:
-        # Generate list items for each HTML file
-        items = []
-        for file in html_files:
-            items.append(f'        <li class="document-item">\n            <a href="{file["path"]}" class="document-link">{file["title"]}</a>\n            <span class="document-date">{file["date"]}</span>\n        </li>')
-
-        content = f'    <ul class="document-list">\n{"".join(items)}\n    </ul>'
-    else:
-        content = '    <div class="no-documents">No documents available yet.</div>'
-
-    # Fill in the template
-    html_content = html_template.format(
-        date=datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-        content=content
-    )
-
-    # Write the index page to the root directory
-    index_path = os.path.join(output_dir, "index.html")
-    with open(index_path, "w", encoding="utf-8") as f:
-        f.write(html_content)
-
-    print(f"Created improved index page at {index_path}")
-    return index_path
-
 if __name__ == "__main__":
     converted = convert_pdfs()
     print(f"Converted {len(converted)} PDFs to HTML")
@@ -1,41 +1,127 @@
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import os
-import json
+import shutil
 import time
+import random
 from urllib.parse import urlparse
+from concurrent.futures import ThreadPoolExecutor
+
+from _jsonio import read_json, write_json
 
 # Configuration
 DOWNLOAD_DIR = "downloads"
+# 64 KiB per read while streaming PDFs to disk. A read cut off midway is
+# discarded whole, so this is also how much a resume can lose
+CHUNK_SIZE = 64 * 1024
+MAX_PDF_SIZE = 500 * 1024 * 1024  # FIA documents are far below this
+DOWNLOAD_WORKERS = 8  # Concurrent downloads against fia.com
+
+# Rate limiting and gateway errors are retried by the adapter, honouring
+# Retry-After; download_pdf's own loop handles transfers cut off midway
+RETRY_POLICY = Retry(
+    total=3,
+    backoff_factor=0.5,
+    status_forcelist=[429, 500, 502, 503, 504],
+    respect_retry_after_header=True,
+    raise_on_status=False
+)
+
+# Shared session so every download reuses pooled keep-alive connections
+SESSION = requests.Session()
+SESSION.mount("https://", HTTPAdapter(pool_connections=16, pool_maxsize=16, max_retries=RETRY_POLICY))
+SESSION.mount("http://", HTTPAdapter(pool_connections=16, pool_maxsize=16, max_retries=RETRY_POLICY))
 
 def ensure_dir(directory):
     """Ensure the directory exists"""
     if not os.path.exists(directory):
         os.makedirs(directory)
 
-def download_pdf(pdf_info):
-    """Download a PDF file"""
-    url = pdf_info['url']
-    filename = os.path.basename(urlparse(url).path)
+def is_valid_pdf(path):
+    """Check that a downloaded file looks like a PDF before GROBID sees it"""
+    size = os.path.getsize(path)
+    if size == 0 or size > MAX_PDF_SIZE:
+        return False
+    with open(path, 'rb') as f:
+        return f.read(5) == b'%PDF-'
+
+def pdf_filepath(pdf_info):
+    """Local path a PDF is downloaded to"""
+    filename = os.path.basename(urlparse(pdf_info['url']).path)
     
     # Create a sanitized filename from the title if available
     if pdf_info.get('title'):
         sanitized_title = "".join([c if c.isalnum() or c in [' ', '.', '-', '_'] else '_' for c in pdf_info['title']])
         filename = f"{sanitized_title}.pdf"
     
-    filepath = os.path.join(DOWNLOAD_DIR, filename)
+    return os.path.join(DOWNLOAD_DIR, filename)
+
+def download_pdf(pdf_info, filepath=None):
+    """Download a PDF file"""
+    url = pdf_info['url']
+    if filepath is None:
+        filepath = pdf_filepath(pdf_info)
     
     print(f"Downloading {url} to {filepath}")
     
-    # Download with retry logic
+    # Download with retry logic, resuming from whatever a failed attempt wrote.
+    # Only bytes this call wrote are resumed: a file left by an earlier run
+    # stays untouched until an attempt opens it for 'wb' and truncates it
     max_retries = 3
+    written = False
+    validator = None  # ETag or Last-Modified of the copy being resumed
     for attempt in range(max_retries):
         try:
-            response = requests.get(url, stream=True)
-            response.raise_for_status()
+            offset = os.path.getsize(filepath) if written and os.path.exists(filepath) else 0
             
-            with open(filepath, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    f.write(chunk)
+            # Ask for the raw bytes so a byte range lines up with the file on disk
+            headers = {'Accept-Encoding': 'identity'}
+            if offset:
+                headers['Range'] = f'bytes={offset}-'
+                # If the server's copy changed since, it sends the whole file
+                if validator:
+                    headers['If-Range'] = validator
+            
+            with SESSION.get(url, stream=True, headers=headers, timeout=(5, 60)) as response:
+                if response.status_code == 416:
+                    # The partial file doesn't fit the server's copy - start
+                    # over straight away, there is nothing to back off from
+                    os.remove(filepath)
+                    written = False
+                    continue
+                response.raise_for_status()
+                
+                # A 200 means the server ignored the range and sent everything
+                resumed = offset > 0 and response.status_code == 206
+                if not resumed:
+                    offset = 0
+                
+                # Don't stream a body that would be rejected anyway
+                length = response.headers.get('Content-Length')
+                if length and length.isdigit() and offset + int(length) > MAX_PDF_SIZE:
+                    print(f"Skipping {url}: {offset + int(length)} bytes is over the size limit")
+                    return None
+                
+                if resumed:
+                    print(f"Resuming {url} from byte {offset}")
+                else:
+                    # A weak ETag can't validate a byte range, fall back to the date
+                    etag = response.headers.get('ETag')
+                    if etag and not etag.startswith('W/'):
+                        validator = etag
+                    else:
+                        validator = response.headers.get('Last-Modified')
+                response.raw.decode_content = True
+                with open(filepath, 'ab' if resumed else 'wb') as f:
+                    written = True
+                    shutil.copyfileobj(response.raw, f, length=CHUNK_SIZE)
+            
+            # An HTML error or login page won't turn into a PDF on retry
+            if not is_valid_pdf(filepath):
+                print(f"Downloaded file is not a valid PDF, discarding: {url}")
+                os.remove(filepath)
+                return None
             
             # Update the PDF info with the local path
             pdf_info['local_path'] = filepath
@@ -44,10 +130,10 @@ def download_pdf(pdf_info):
         except Exception as e:
             print(f"Attempt {attempt + 1} failed: {str(e)}")
             if attempt < max_retries - 1:
-                time.sleep(2)  # Wait before retrying
-            else:
-                print(f"Failed to download {url} after {max_retries} attempts")
-                return None
+                time.sleep(2 ** attempt + random.random())  # Back off, with jitter
+    
+    print(f"Failed to download {url} after {max_retries} attempts")
+    return None
                 
 
 def download_new_pdfs():
@@ -58,18 +144,29 @@ def download_new_pdfs():
         print("No new PDFs to download")
         return []
     
-    with open("new_pdfs.json", "r") as f:
-        new_pdfs = json.load(f)
+    new_pdfs = read_json("new_pdfs.json")
     
-    downloaded_pdfs = []
+    # PDFs whose titles sanitize to the same name get their own file, so
+    # two parallel downloads never write to one path
+    filepaths = []
+    taken = set()
     for pdf_info in new_pdfs:
-        result = download_pdf(pdf_info)
-        if result:
-            downloaded_pdfs.append(result)
+        filepath = pdf_filepath(pdf_info)
+        stem, ext = os.path.splitext(filepath)
+        suffix = 2
+        while filepath in taken:
+            filepath = f"{stem}_{suffix}{ext}"
+            suffix += 1
+        taken.add(filepath)
+        filepaths.append(filepath)
+    
+    # Downloads are network-bound, so overlap them; map keeps input order
+    with ThreadPoolExecutor(max_workers=DOWNLOAD_WORKERS) as executor:
+        results = list(executor.map(download_pdf, new_pdfs, filepaths))
+    downloaded_pdfs = [result for result in results if result]
     
     # Save the downloaded PDFs info
-    with open("downloaded_pdfs.json", "w") as f:
-        json.dump(downloaded_pdfs, f, indent=2)
+    write_json("downloaded_pdfs.json", downloaded_pdfs)
     
     return downloaded_pdfs
 
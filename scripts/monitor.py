@@ -1,52 +1,92 @@
 import requests
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 import os
-import json
 import datetime
+import re
+
+from _jsonio import dumps, loads, read_json, write_json
+
+try:
+    import lxml  # noqa: F401 - only needed as a BeautifulSoup backend
+    HTML_PARSER = 'lxml'
+except ImportError:
+    HTML_PARSER = 'html.parser'
 
 # Configuration
 FIA_URL = "https://www.fia.com/documents/championships/fia-formula-one-world-championship-14/"
-KNOWN_PDFS_FILE = "known_pdfs.json"
+KNOWN_PDFS_FILE = "known_pdfs.json"  # Legacy list, migrated to the log below
+KNOWN_PDFS_LOG = "known_pdfs.jsonl"  # One JSON record per line, append-only
+
+# Only <a> tags pointing at PDFs are built into the parse tree
+PDF_ANCHORS = SoupStrainer('a', href=re.compile(r'\.pdf$'))
+
+# Shared session so requests to fia.com reuse a pooled keep-alive connection
+SESSION = requests.Session()
 
 def get_pdf_links():
     """Scrape the FIA website for PDF links"""
-    response = requests.get(FIA_URL)
-    soup = BeautifulSoup(response.text, 'html.parser')
+    response = SESSION.get(FIA_URL, timeout=(5, 60))
+    soup = BeautifulSoup(response.content, HTML_PARSER, parse_only=PDF_ANCHORS)
+    now = datetime.datetime.now().isoformat()
     
     pdf_links = []
-    # Adjust the selector based on the actual structure of the FIA website
-    for link in soup.select('a[href$=".pdf"]'):
+    # Adjust the filter based on the actual structure of the FIA website
+    for link in soup.find_all('a'):
         pdf_links.append({
             'url': link['href'] if link['href'].startswith('http') else f"https://www.fia.com{link['href']}",
             'title': link.text.strip() or os.path.basename(link['href']),
-            'date': datetime.datetime.now().isoformat()
+            'date': now
         })
     
     return pdf_links
 
+def encode_record(record):
+    """Encode one record as a single JSON line"""
+    return dumps(record) + b"\n"
+
 def load_known_pdfs():
     """Load the list of already processed PDFs"""
-    if os.path.exists(KNOWN_PDFS_FILE):
-        with open(KNOWN_PDFS_FILE, 'r') as f:
-            return json.load(f)
-    return []
+    if not os.path.exists(KNOWN_PDFS_LOG):
+        # First run with the log - migrate the old whole-file list
+        if not os.path.exists(KNOWN_PDFS_FILE):
+            return []
+        known_pdfs = read_json(KNOWN_PDFS_FILE)
+        append_known_pdfs(known_pdfs)
+        return known_pdfs
+
+    known_pdfs = []
+    with open(KNOWN_PDFS_LOG, 'rb') as f:
+        for line in f:
+            try:
+                known_pdfs.append(loads(line))
+            except ValueError:
+                continue  # A torn last line from an interrupted run
+    return known_pdfs
 
-def save_known_pdfs(pdfs):
-    """Save the updated list of processed PDFs"""
-    with open(KNOWN_PDFS_FILE, 'w') as f:
-        json.dump(pdfs, f, indent=2)
+def append_known_pdfs(pdfs):
+    """Append newly found PDFs to the list of processed PDFs"""
+    with open(KNOWN_PDFS_LOG, 'ab+') as f:
+        # Terminate a torn last line so it cannot swallow the first new record
+        if f.tell() > 0:
+            f.seek(-1, os.SEEK_END)
+            if f.read(1) != b"\n":
+                f.write(b"\n")
+        f.write(b"".join(encode_record(pdf) for pdf in pdfs))
 
 def find_new_pdfs():
     """Identify new PDFs that haven't been processed yet"""
     current_pdfs = get_pdf_links()
     known_pdfs = load_known_pdfs()
     
-    known_urls = [pdf['url'] for pdf in known_pdfs]
-    new_pdfs = [pdf for pdf in current_pdfs if pdf['url'] not in known_urls]
+    known_urls = {pdf['url'] for pdf in known_pdfs}
+    new_pdfs = []
+    for pdf in current_pdfs:
+        if pdf['url'] not in known_urls:
+            known_urls.add(pdf['url'])  # Also drops repeats within this scrape
+            new_pdfs.append(pdf)
     
     if new_pdfs:
-        known_pdfs.extend(new_pdfs)
-        save_known_pdfs(known_pdfs)
+        append_known_pdfs(new_pdfs)
     
     return new_pdfs
 
@@ -55,7 +95,6 @@ if __name__ == "__main__":
     if new_pdfs:
         print(f"Found {len(new_pdfs)} new PDFs")
         # Output the new PDFs in a format that can be used by the next step
-        with open("new_pdfs.json", "w") as f:
-            json.dump(new_pdfs, f, indent=2)
+        write_json("new_pdfs.json", new_pdfs)
     else:
         print("No new PDFs found")
\ No newline at end of file